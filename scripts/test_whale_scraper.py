@@ -0,0 +1,343 @@
+"""Tests for whale_scraper.py (run from scripts/: python -m pytest -q)."""
+
+import json
+
+import pytest
+
+import whale_scraper as ws
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# REGION PROFILES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def write_config(tmp_path, config):
+    path = tmp_path / 'regions.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def test_profile_config_runs_only_its_own_profiles(tmp_path):
+    path = write_config(tmp_path, {'fresno': {'cities': ['Fresno'], 'min_value': '7500'}})
+
+    profiles = ws.load_profiles(path)
+
+    assert list(profiles) == ['fresno']
+    assert profiles['fresno']['cities'] == ['FRESNO']
+    assert profiles['fresno']['min_value'] == 7500
+    assert profiles['fresno']['limit'] == ws.DEFAULT_LEAD_LIMIT
+
+
+def test_profile_config_can_be_combined_with_builtins(tmp_path):
+    path = write_config(tmp_path, {'fresno': {'cities': ['FRESNO']}})
+
+    profiles = ws.load_profiles(path, ['sacramento', 'fresno'])
+
+    assert list(profiles) == ['sacramento', 'fresno']
+
+
+def test_no_config_runs_all_builtins():
+    assert list(ws.load_profiles()) == list(ws.REGION_PROFILES)
+
+
+@pytest.mark.parametrize('profile, message', [
+    ({'cities': 'FRESNO'}, "'cities' must be a non-empty list"),
+    ({'cities': []}, "'cities' must be a non-empty list"),
+    ({'cities': ['FRESNO', 3]}, "'cities' must be a non-empty list"),
+    ({'cities': ['FRESNO'], 'min_value': 'lots'}, "'min_value' must be an integer"),
+    ({'cities': ['FRESNO'], 'limit': None}, "'limit' must be an integer"),
+])
+def test_profile_config_is_validated(tmp_path, profile, message):
+    path = write_config(tmp_path, {'fresno': profile})
+
+    with pytest.raises(ValueError, match=message) as exc:
+        ws.load_profiles(path)
+    assert 'fresno' in str(exc.value)
+
+
+def test_profiles_sharing_an_output_are_rejected(tmp_path):
+    path = write_config(tmp_path, {
+        'fresno': {'cities': ['FRESNO'], 'output': 'central.csv'},
+        'modesto': {'cities': ['MODESTO'], 'output': './central.csv'},
+        'bakersfield': {'cities': ['BAKERSFIELD']},
+    })
+
+    with pytest.raises(ValueError, match='share an output file: fresno, modesto'):
+        ws.load_profiles(path)
+
+
+def test_city_names_are_matched_literally():
+    cities = ws.pd.Series(['ST. HELENA', 'STX HELENA', 'FOO (BAR)', 'FOO BAR'])
+
+    assert ws.city_mask(cities, ['ST. HELENA', 'FOO (BAR)']).tolist() == [True, False, True, False]
+
+
+def test_unknown_profile_name_is_rejected():
+    with pytest.raises(ValueError, match='Unknown region profile'):
+        ws.load_profiles(names=['atlantis'])
+
+
+@pytest.mark.parametrize('flag', [['--min-value', '1000'], ['--limit', '5'], ['-o', 'x.csv']])
+def test_single_run_flags_conflict_with_profiles(monkeypatch, capsys, flag):
+    monkeypatch.setattr('sys.argv', ['whale_scraper.py', 'data.csv', '--profiles', 'sacramento'] + flag)
+
+    with pytest.raises(SystemExit):
+        ws.main()
+    assert 'cannot be combined with --profiles' in capsys.readouterr().err
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# COMPRESSED INPUTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+SCO_CSV = (
+    'Owner Name,City,Cash Reported\n'
+    'ACME HOLDINGS LLC,SACRAMENTO,"$12,500"\n'
+    'JOHN SMITH,SACRAMENTO,"$90,000"\n'
+    'BIG CORP,OAKLAND,"$250,000"\n'
+    'TINY LLC,FOLSOM,$600\n'
+).encode('utf-8')
+
+
+def write_gz(path, data):
+    import gzip
+    with gzip.open(path, 'wb') as f:
+        f.write(data)
+
+
+def write_xz(path, data):
+    import lzma
+    with lzma.open(path, 'wb') as f:
+        f.write(data)
+
+
+def write_zst(path, data):
+    zstandard = pytest.importorskip('zstandard')
+    # Two frames, as written by pzstd or `zstd -T`
+    cctx = zstandard.ZstdCompressor()
+    half = len(data) // 2
+    with open(path, 'wb') as f:
+        f.write(cctx.compress(data[:half]))
+        f.write(cctx.compress(data[half:]))
+
+
+def write_zip(path, data):
+    import zipfile
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('README.txt', 'not the data')
+        z.writestr('properties.csv', data)
+        z.writestr('empty.csv', 'a,b\n')
+
+
+@pytest.mark.parametrize('suffix, writer', [
+    ('.csv.gz', write_gz),
+    ('.csv.xz', write_xz),
+    ('.csv.zst', write_zst),
+    ('.zip', write_zip),
+])
+def test_open_sco_source_round_trip(tmp_path, suffix, writer):
+    path = str(tmp_path / f'sco{suffix}')
+    writer(path, SCO_CSV)
+
+    # One large read must not stop at an internal (zstd frame) boundary
+    with ws.open_sco_source(path) as f:
+        assert f.read(1 << 20) == SCO_CSV
+
+
+def test_zip_member_can_be_selected(tmp_path):
+    path = str(tmp_path / 'sco.zip')
+    write_zip(path, SCO_CSV)
+
+    with ws.open_sco_source(path, 'empty.csv') as f:
+        assert f.read() == b'a,b\n'
+    with pytest.raises(ValueError, match='not found'):
+        ws.open_sco_source(path, 'missing.csv')
+
+
+def test_scan_profiles_streams_compressed_input(tmp_path):
+    path = str(tmp_path / 'sco.csv.gz')
+    write_gz(path, SCO_CSV)
+    profiles = ws.load_profiles(names=['sacramento', 'bay_area'])
+
+    results = ws.scan_profiles(path, profiles, chunksize=2)
+
+    sacramento, cash_col, owner_col, _ = results['sacramento']
+    assert sacramento[owner_col].tolist() == ['ACME HOLDINGS LLC']
+    assert sacramento[cash_col].tolist() == [12500]
+    assert results['bay_area'][0][owner_col].tolist() == ['BIG CORP']
+
+
+def test_scan_profiles_handles_chunk_with_blank_cities(tmp_path):
+    path = tmp_path / 'sco.csv'
+    path.write_text(
+        'Owner Name,City,Cash Reported\n'
+        'A LLC,,"$9,000"\n'
+        'B LLC,,"$9,000"\n'
+        'C LLC,SACRAMENTO,"$9,000"\n'
+    )
+    profiles = ws.load_profiles(names=['sacramento'])
+
+    whales, _, owner_col, _ = ws.scan_profiles(str(path), profiles, chunksize=2)['sacramento']
+
+    assert whales[owner_col].tolist() == ['C LLC']
+
+
+def test_zip_member_requires_zip_input(monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['whale_scraper.py', 'data.csv.gz', '--zip-member', 'x.csv'])
+
+    with pytest.raises(SystemExit):
+        ws.main()
+    assert '--zip-member only applies to .zip inputs' in capsys.readouterr().err
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ENRICHMENT PROVIDER CHAIN
+# ═══════════════════════════════════════════════════════════════════════════
+
+class FakeProvider:
+    """Deterministic lookup: hits on `hit_every`-th call, optionally always raising."""
+
+    def __init__(self, hit_every: int = None, fails: bool = False, result: dict = None):
+        self.hit_every = hit_every
+        self.fails = fails
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, company, city=None):
+        self.calls += 1
+        if self.fails:
+            raise ws.ProviderError('HTTP 503')
+        if self.result is not None:
+            return self.result
+        if self.hit_every and self.calls % self.hit_every == 0:
+            return {'name': 'Pat', 'email': 'pat@example.com'}
+        return None
+
+
+def make_chain(**lookups):
+    providers = [ws.EnrichmentProvider(name, lookup, delay=0) for name, lookup in lookups.items()]
+    return ws.ProviderChain(providers)
+
+
+def test_high_hit_provider_keeps_its_lead():
+    # 80% / 10% / 10% hit rates; match is the primary
+    match_hits = iter([True, True, True, True, False] * 100)
+    chain = make_chain(match=lambda company, city=None: {'email': 'm@x'} if next(match_hits) else None,
+                       search=FakeProvider(hit_every=10), hunter=FakeProvider(hit_every=10))
+
+    orders = []
+    for i in range(300):
+        chain.enrich(f'CO {i} LLC', 'SACRAMENTO')
+        orders.append([p.name for p in chain.ordered()])
+
+    assert all(order[0] == 'match' for order in orders)
+
+
+def test_reorders_by_hits_per_credit_once_warm():
+    weak = FakeProvider()
+    strong = FakeProvider(hit_every=1)
+    chain = make_chain(weak=weak, strong=strong)
+
+    for i in range(ws.PROVIDER_REORDER_MIN_CALLS + 1):
+        chain.enrich(f'CO {i} LLC')
+
+    assert [p.name for p in chain.ordered()] == ['strong', 'weak']
+
+
+def test_partial_match_not_cached_when_a_provider_failed():
+    failing = FakeProvider(fails=True)
+    chain = make_chain(partial=FakeProvider(result={'name': 'Bob'}), failing=failing)
+
+    assert chain.enrich('ACME LLC') == {'name': 'Bob'}
+    chain.enrich('ACME LLC')
+
+    assert failing.calls == 2
+    assert chain.cache_hits == 0
+
+
+def test_hit_and_definitive_miss_are_cached():
+    hit = FakeProvider(hit_every=1)
+    miss = FakeProvider()
+    chain = make_chain(miss=miss, hit=hit)
+
+    chain.enrich('ACME LLC')
+    chain.enrich('ACME  llc')
+    assert (miss.calls, hit.calls, chain.cache_hits) == (1, 1, 1)
+
+    only_miss = make_chain(miss=FakeProvider())
+    only_miss.enrich('ACME LLC')
+    only_miss.enrich('ACME LLC')
+    assert only_miss.cache_hits == 1
+
+
+def test_circuit_skips_failing_provider():
+    failing = FakeProvider(fails=True)
+    chain = make_chain(failing=failing, ok=FakeProvider(hit_every=1))
+
+    for i in range(10):
+        chain.enrich(f'CO {i} LLC')
+
+    assert failing.calls == ws.CIRCUIT_MAX_CONSECUTIVE_FAILURES
+    assert chain.providers[0].health.skipped == 10 - ws.CIRCUIT_MAX_CONSECUTIVE_FAILURES
+
+
+def test_delay_only_between_calls_to_same_api(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(ws.time, 'sleep', sleeps.append)
+    chain = ws.ProviderChain([
+        ws.EnrichmentProvider('match', FakeProvider(), delay=0.5, api='apollo'),
+        ws.EnrichmentProvider('search', FakeProvider(), delay=0.5, api='apollo'),
+        ws.EnrichmentProvider('hunter', FakeProvider(), delay=0.5, api='hunter'),
+    ])
+
+    chain.enrich('ACME LLC')
+
+    # One wait before the second Apollo call; none for Hunter's first call
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 0.5
+
+
+def test_enrich_whale_falls_back_to_search_on_match_error(monkeypatch):
+    apollo = ws.ApolloEnricher('key')
+    monkeypatch.setattr(apollo, 'match_person', FakeProvider(fails=True))
+    monkeypatch.setattr(apollo, 'search_people', FakeProvider(hit_every=1))
+
+    assert apollo.enrich_whale('ACME LLC', 'SACRAMENTO') == {'name': 'Pat', 'email': 'pat@example.com'}
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize('status', [400, 401, 402, 403, 422, 429, 500, 503])
+def test_non_200_non_404_is_a_provider_error(status):
+    with pytest.raises(ws.ProviderError, match=str(status)):
+        ws.check_provider_response(FakeResponse(status), 'Test')
+
+
+def test_404_is_a_miss():
+    assert ws.check_provider_response(FakeResponse(404), 'Test') is False
+
+
+def test_out_of_credits_counts_as_failure_and_is_not_cached():
+    calls = []
+
+    def out_of_credits(company, city=None):
+        calls.append(company)
+        ws.check_provider_response(FakeResponse(402), 'Test')
+
+    chain = make_chain(broke=out_of_credits)
+    chain.enrich('ACME LLC')
+    chain.enrich('ACME LLC')
+
+    health = chain.providers[0].health
+    assert health.total_failures == 2
+    assert len(calls) == 2
+    assert chain.cache_hits == 0
+
+
+@pytest.mark.parametrize('cost', [0, -1])
+def test_credit_cost_must_be_positive(cost):
+    with pytest.raises(ValueError, match='credit_cost must be positive'):
+        ws.EnrichmentProvider('free', FakeProvider(), credit_cost=cost)
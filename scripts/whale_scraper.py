@@ -13,7 +13,10 @@ Download: 'Properties $500 and up' CSV file
 
 Features:
 - Filters for Sacramento + Bay Area businesses with $5k+ unclaimed
+- Region profiles: many city sets / thresholds in a single pass over the file
+- Streams .zip / .gz / .zst / .xz downloads directly (no scratch decompression)
 - Enriches with CEO/CFO/Owner contact info via Apollo.io
+- Circuit-broken, memoised provider fallback chain (Apollo → Hunter)
 - Outputs ready-to-dial lead list with emails, phones, LinkedIn
 
 Legal Compliance:
@@ -31,6 +34,15 @@ Usage:
     # Limit results
     python whale_scraper.py ca_unclaimed_500_plus.csv --enrich --limit 100
 
+    # Several regions in one pass over the file (one export per profile)
+    python whale_scraper.py ca_unclaimed_500_plus.csv --profiles sacramento,bay_area,los_angeles,san_diego
+
+    # Read the SCO download directly from its archive
+    python whale_scraper.py ca_unclaimed_500_plus.zip --zip-member 'Properties_500_and_up.csv'
+
+    # Custom region profiles from a JSON config
+    python whale_scraper.py ca_unclaimed_500_plus.csv --profile-config regions.json
+
 Author: LawAuditor Team
 """
 
@@ -40,8 +52,13 @@ import requests
 import time
 import os
 import json
+import re
+import gzip
+import lzma
+import zipfile
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -73,6 +90,48 @@ TARGET_TITLES = [
 # Minimum cash value for "whale" status
 MIN_WHALE_VALUE = 5000
 
+# Region profiles: each one is evaluated in the same scan of the SCO file
+# and written to its own export. Add or override with --profile-config,
+# a JSON file of the same shape (runs only its own profiles unless
+# --profiles also names built-ins):
+#   { "name": { "cities": [...], "min_value": 5000, "limit": 200, "output": "x.csv" } }
+REGION_PROFILES = {
+    'sacramento': {
+        'cities': ['SACRAMENTO', 'WEST SACRAMENTO', 'ELK GROVE', 'FOLSOM', 'ROSEVILLE'],
+        'min_value': 5000,
+        'limit': 200,
+        'output': 'sacramento_whales.csv'
+    },
+    'bay_area': {
+        'cities': [
+            'SAN FRANCISCO', 'OAKLAND', 'BERKELEY', 'PALO ALTO', 'MENLO PARK',
+            'SAN JOSE', 'SANTA CLARA', 'SUNNYVALE', 'MOUNTAIN VIEW', 'CUPERTINO',
+            'FREMONT', 'HAYWARD', 'SAN MATEO', 'REDWOOD CITY', 'DALY CITY'
+        ],
+        'min_value': 10000,
+        'limit': 200,
+        'output': 'bay_area_whales.csv'
+    },
+    'los_angeles': {
+        'cities': [
+            'LOS ANGELES', 'SANTA MONICA', 'BEVERLY HILLS', 'PASADENA', 'GLENDALE',
+            'BURBANK', 'LONG BEACH', 'TORRANCE', 'CULVER CITY', 'IRVINE'
+        ],
+        'min_value': 25000,
+        'limit': 200,
+        'output': 'los_angeles_whales.csv'
+    },
+    'san_diego': {
+        'cities': ['SAN DIEGO', 'LA JOLLA', 'CHULA VISTA', 'CARLSBAD', 'ESCONDIDO', 'OCEANSIDE'],
+        'min_value': 10000,
+        'limit': 200,
+        'output': 'san_diego_whales.csv'
+    }
+}
+
+# Rows per chunk when streaming the SCO file
+DEFAULT_CHUNK_SIZE = 250000
+
 # California legal fee cap
 CA_FEE_CAP = 0.10  # 10%
 
@@ -82,6 +141,24 @@ DEFAULT_LEAD_LIMIT = 200
 # API rate limiting
 APOLLO_RATE_LIMIT_DELAY = 0.5  # seconds between requests
 
+# Per-request HTTP timeout for enrichment APIs
+ENRICHMENT_TIMEOUT = 10  # seconds
+
+# Enrichment provider health / circuit breaker
+PROVIDER_HEALTH_WINDOW = 20        # rolling window of calls per provider
+CIRCUIT_MIN_CALLS = 5              # calls in window before success rate can trip
+CIRCUIT_MIN_SUCCESS_RATE = 0.5     # trip below this success rate
+CIRCUIT_MAX_CONSECUTIVE_FAILURES = 3
+CIRCUIT_COOLDOWN = 120             # seconds to skip a tripped provider
+PROVIDER_REORDER_MIN_CALLS = 10    # calls before a provider is ranked by hit rate
+
+# Approximate credits per call, used to rank providers by hits per credit
+PROVIDER_CREDIT_COSTS = {
+    'apollo_match': 1,
+    'apollo_search': 1,
+    'hunter_domain': 1
+}
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # APOLLO.IO API INTEGRATION
@@ -129,65 +206,73 @@ class ApolloEnricher:
         Returns: { name, title, email, phone, linkedin }
         """
         try:
-            clean_name = self._clean_company_name(business_name)
-            
             # Primary method: people/match (fastest, most accurate)
-            payload = {
-                "api_key": self.api_key,
-                "organization_name": clean_name,
-                "titles": self.DECISION_MAKER_TITLES
-            }
-            
-            response = self.session.post(
-                f"{self.BASE_URL}/people/match",
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                person = data.get('person')
-                
-                if person:
-                    return self._extract_contact(person)
+            try:
+                contact = self.match_person(business_name, city)
+                if contact:
+                    return contact
+            except ProviderError:
+                # Non-200 from people/match still falls through to search
+                pass
             
             # Fallback: mixed_people/search for broader results
-            return self._search_people_fallback(clean_name, city)
+            return self.search_people(business_name, city)
             
         except Exception as e:
             print(f" ⚠️ {e}")
             return None
     
-    def _search_people_fallback(self, company_name: str, city: str = None) -> Optional[Dict]:
+    def match_person(self, business_name: str, city: str = None) -> Optional[Dict]:
         """
-        Fallback search using mixed_people/search endpoint.
+        Single /v1/people/match lookup.
+        Returns None when nothing matched; raises ProviderError on API failure.
         """
-        try:
-            payload = {
-                "api_key": self.api_key,
-                "q_organization_name": company_name,
-                "person_titles": self.DECISION_MAKER_TITLES,
-                "per_page": 5
-            }
-            
-            if city:
-                payload["person_locations"] = [city.title() + ", California"]
-            
-            response = self.session.post(
-                f"{self.BASE_URL}/mixed_people/search",
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                people = data.get('people', [])
-                
-                if people:
-                    return self._pick_best_contact(people)
-            
-            return None
-            
-        except Exception:
-            return None
+        payload = {
+            "api_key": self.api_key,
+            "organization_name": self._clean_company_name(business_name),
+            "titles": self.DECISION_MAKER_TITLES
+        }
+        
+        response = self.session.post(
+            f"{self.BASE_URL}/people/match",
+            json=payload,
+            timeout=ENRICHMENT_TIMEOUT
+        )
+        
+        if check_provider_response(response, 'Apollo people/match'):
+            person = response.json().get('person')
+            if person:
+                return self._extract_contact(person)
+        
+        return None
+    
+    def search_people(self, business_name: str, city: str = None) -> Optional[Dict]:
+        """
+        Broader /v1/mixed_people/search lookup, best title wins.
+        Returns None when nothing matched; raises ProviderError on API failure.
+        """
+        payload = {
+            "api_key": self.api_key,
+            "q_organization_name": self._clean_company_name(business_name),
+            "person_titles": self.DECISION_MAKER_TITLES,
+            "per_page": 5
+        }
+        
+        if city:
+            payload["person_locations"] = [city.title() + ", California"]
+        
+        response = self.session.post(
+            f"{self.BASE_URL}/mixed_people/search",
+            json=payload,
+            timeout=ENRICHMENT_TIMEOUT
+        )
+        
+        if check_provider_response(response, 'Apollo mixed_people/search'):
+            people = response.json().get('people', [])
+            if people:
+                return self._pick_best_contact(people)
+        
+        return None
     
     def _extract_contact(self, person: Dict) -> Dict:
         """Extract contact info from Apollo person object."""
@@ -218,7 +303,6 @@ class ApolloEnricher:
     
     def _clean_company_name(self, name: str) -> str:
         """Remove common suffixes for better matching."""
-        import re
         cleaned = re.sub(r'\s+(INC\.?|LLC|CORP\.?|LLP|L\.P\.|LP|CORPORATION|COMPANY|CO\.)$', '', name, flags=re.IGNORECASE)
         cleaned = ' '.join(cleaned.split())
         return cleaned
@@ -274,66 +358,378 @@ class HunterEnricher:
         Find company domain and emails.
         """
         try:
-            # First, find the domain
-            response = requests.get(
-                f"{self.BASE_URL}/domain-search",
-                params={
-                    "api_key": self.api_key,
-                    "company": company_name
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json().get('data', {})
-                emails = data.get('emails', [])
-                
-                # Find decision-maker
-                for email in emails:
-                    title = (email.get('position') or '').lower()
-                    if any(t.lower() in title for t in TARGET_TITLES):
-                        return {
-                            'name': f"{email.get('first_name', '')} {email.get('last_name', '')}".strip(),
-                            'title': email.get('position'),
-                            'email': email.get('value'),
-                            'phone': email.get('phone_number'),
-                            'linkedin': email.get('linkedin'),
-                            'company_match': company_name
-                        }
-                
-                # Fallback to first email if no title match
-                if emails:
-                    email = emails[0]
-                    return {
-                        'name': f"{email.get('first_name', '')} {email.get('last_name', '')}".strip(),
-                        'title': email.get('position'),
-                        'email': email.get('value'),
-                        'phone': email.get('phone_number'),
-                        'linkedin': email.get('linkedin'),
-                        'company_match': company_name
-                    }
-            
-            return None
-            
+            return self.find_contact(company_name)
         except Exception as e:
             print(f"      ⚠️ Hunter error: {e}")
             return None
+    
+    def find_contact(self, company_name: str, city: str = None) -> Optional[Dict]:
+        """
+        Single /v2/domain-search lookup, preferring decision-maker titles.
+        Returns None when nothing matched; raises ProviderError on API failure.
+        """
+        response = requests.get(
+            f"{self.BASE_URL}/domain-search",
+            params={
+                "api_key": self.api_key,
+                "company": company_name
+            },
+            timeout=ENRICHMENT_TIMEOUT
+        )
+        
+        if not check_provider_response(response, 'Hunter domain-search'):
+            return None
+        
+        emails = response.json().get('data', {}).get('emails', [])
+        if not emails:
+            return None
+        
+        # Find decision-maker, fall back to first email if no title match
+        best = emails[0]
+        for email in emails:
+            title = (email.get('position') or '').lower()
+            if any(t.lower() in title for t in TARGET_TITLES):
+                best = email
+                break
+        
+        return {
+            'name': f"{best.get('first_name', '')} {best.get('last_name', '')}".strip(),
+            'title': best.get('position'),
+            'email': best.get('value'),
+            'phone': best.get('phone_number'),
+            'linkedin': best.get('linkedin'),
+            'company_match': company_name
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ENRICHMENT PROVIDER CHAIN
+# ═══════════════════════════════════════════════════════════════════════════
+
+class ProviderError(Exception):
+    """An enrichment API call failed (auth, credits, bad request, rate limit, server error)."""
+
+
+def check_provider_response(response: requests.Response, label: str) -> bool:
+    """
+    Classify an enrichment API response.
+    True on 200, False on 404 (no match), raises ProviderError on any other
+    status so out-of-credits (402), rejected requests, rate limits and
+    server errors count against the provider's health.
+    Apollo and Hunter report "nothing found" as a 200 with an empty body.
+    """
+    if response.status_code == 200:
+        return True
+    if response.status_code == 404:
+        return False
+    raise ProviderError(f"{label}: HTTP {response.status_code}")
+
+
+class ProviderHealth:
+    """
+    Rolling success-rate / latency / hit-rate tracker with a circuit breaker.
+    
+    The circuit opens after CIRCUIT_MAX_CONSECUTIVE_FAILURES failures in a row,
+    or when the windowed success rate drops below CIRCUIT_MIN_SUCCESS_RATE.
+    While open the provider is skipped; after CIRCUIT_COOLDOWN one trial call
+    is let through (half-open) and its outcome closes or re-opens the circuit.
+    """
+    
+    def __init__(self, window: int = PROVIDER_HEALTH_WINDOW,
+                 cooldown: float = CIRCUIT_COOLDOWN):
+        self.calls = deque(maxlen=window)  # (ok, hit, latency)
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.half_open = False
+        self.total_calls = 0
+        self.total_hits = 0
+        self.total_failures = 0
+        self.skipped = 0
+        self.trips = 0
+    
+    def is_available(self) -> bool:
+        if self.open_until == 0.0:
+            return True
+        if time.monotonic() >= self.open_until:
+            # Cooldown over: allow a single trial call
+            self.half_open = True
+            self.open_until = 0.0
+            return True
+        return False
+    
+    def record(self, ok: bool, hit: bool, latency: float):
+        self.calls.append((ok, hit, latency))
+        self.total_calls += 1
+        self.total_hits += int(hit)
+        
+        if ok:
+            if self.half_open:
+                # Recovered: judge it on fresh calls only
+                self.calls.clear()
+                self.half_open = False
+            self.consecutive_failures = 0
+            return
+        
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        
+        if (self.half_open
+                or self.consecutive_failures >= CIRCUIT_MAX_CONSECUTIVE_FAILURES
+                or (len(self.calls) >= CIRCUIT_MIN_CALLS
+                    and self.success_rate < CIRCUIT_MIN_SUCCESS_RATE)):
+            self.trip()
+    
+    def trip(self):
+        self.open_until = time.monotonic() + self.cooldown
+        self.half_open = False
+        self.trips += 1
+        self.consecutive_failures = 0
+    
+    @property
+    def is_open(self) -> bool:
+        """Circuit is open and still cooling down (no side effects)."""
+        return self.open_until != 0.0 and time.monotonic() < self.open_until
+    
+    @property
+    def success_rate(self) -> float:
+        if not self.calls:
+            return 1.0
+        return sum(1 for ok, _, _ in self.calls if ok) / len(self.calls)
+    
+    @property
+    def lifetime_success_rate(self) -> float:
+        if not self.total_calls:
+            return 1.0
+        return 1 - self.total_failures / self.total_calls
+    
+    @property
+    def hit_rate(self) -> float:
+        if not self.calls:
+            return 0.0
+        return sum(1 for _, hit, _ in self.calls if hit) / len(self.calls)
+    
+    @property
+    def avg_latency(self) -> float:
+        if not self.calls:
+            return 0.0
+        return sum(latency for _, _, latency in self.calls) / len(self.calls)
+
+
+class EnrichmentProvider:
+    """
+    One step of the enrichment chain.
+    
+    `lookup(company, city)` returns a contact dict, None for no match, or
+    raises on failure. Anything with that signature can be plugged in.
+    `delay` is the minimum gap between calls to the same `api` (providers
+    sharing an API key, e.g. the two Apollo endpoints, share the gap).
+    `credit_cost` must be positive; use a small fraction for near-free endpoints.
+    """
+    
+    def __init__(self, name: str, lookup: Callable[[str, Optional[str]], Optional[Dict]],
+                 credit_cost: float = 1, delay: float = APOLLO_RATE_LIMIT_DELAY,
+                 api: str = None):
+        if not credit_cost or credit_cost <= 0:
+            raise ValueError(f"Provider '{name}': credit_cost must be positive, got {credit_cost!r}")
+        self.name = name
+        self.lookup = lookup
+        self.credit_cost = credit_cost
+        self.delay = delay
+        self.api = api or name
+        self.health = ProviderHealth()
+    
+    @property
+    def hits_per_credit(self) -> float:
+        return self.health.hit_rate / self.credit_cost
+
+
+class ProviderChain:
+    """
+    Ordered fallback chain of enrichment providers.
+    
+    - Results are memoised per (company, city), so duplicate owners across
+      rows or region profiles cost no extra credits.
+    - Providers with an open circuit are skipped.
+    - With reorder=True, once every available provider has
+      PROVIDER_REORDER_MIN_CALLS calls the chain is ranked by hits per credit
+      (ties: lower latency, then configured order). Until then the
+      configured order is kept.
+    - Calls to the same API are spaced by the provider's delay; there is no
+      wait when moving on to a different API.
+    """
+    
+    def __init__(self, providers: List[EnrichmentProvider], reorder: bool = True):
+        self.providers = list(providers)
+        self.reorder = reorder
+        self.cache = {}
+        self.cache_hits = 0
+        self.last_call = {}  # api -> time.monotonic() of its last call
+    
+    def __bool__(self):
+        return bool(self.providers)
+    
+    def ordered(self) -> List[EnrichmentProvider]:
+        if not self.reorder:
+            return self.providers
+        active = [p for p in self.providers if not p.health.is_open]
+        if any(p.health.total_calls < PROVIDER_REORDER_MIN_CALLS for p in active):
+            return self.providers
+        # sorted() is stable, so configured order breaks remaining ties
+        return sorted(self.providers, key=lambda p: (-p.hits_per_credit, p.health.avg_latency))
+    
+    def enrich(self, company: str, city: str = None) -> Optional[Dict]:
+        key = (' '.join(company.upper().split()), (city or '').upper())
+        if key in self.cache:
+            self.cache_hits += 1
+            return self.cache[key]
+        
+        contact = None
+        hit = False
+        all_answered = True
+        
+        for provider in self.ordered():
+            if not provider.health.is_available():
+                provider.health.skipped += 1
+                all_answered = False
+                continue
+            
+            self._wait_for(provider)
+            started = time.monotonic()
+            try:
+                result = provider.lookup(company, city)
+                ok = True
+            except Exception:
+                result = None
+                ok = False
+                all_answered = False
+            finished = time.monotonic()
+            self.last_call[provider.api] = finished
+            
+            hit = bool(result and (result.get('email') or result.get('phone')))
+            provider.health.record(ok, hit, finished - started)
+            
+            if hit:
+                contact = result
+                break
+            # Keep a partial match (name/title only) unless a later provider does better
+            contact = contact or result
+        
+        # Don't memoise a miss (or partial match) caused by failing/skipped providers; retry it later
+        if hit or all_answered:
+            self.cache[key] = contact
+        
+        return contact
+    
+    def _wait_for(self, provider: EnrichmentProvider):
+        """Sleep only as long as needed to keep `delay` between calls to the same API."""
+        last = self.last_call.get(provider.api)
+        if last is None or not provider.delay:
+            return
+        remaining = provider.delay - (time.monotonic() - last)
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def print_summary(self):
+        print(f"\n   🔌 PROVIDER HEALTH (memoised lookups: {self.cache_hits})")
+        print(f"   {'Provider':<16}{'Calls':>6}{'Hits':>6}{'Fail':>6}{'Skip':>6}"
+              f"{'OK%':>7}{'Lat(s)':>8}{'Hit/Cr':>8}{'Trips':>6}")
+        for p in self.ordered():
+            h = p.health
+            print(f"   {p.name:<16}{h.total_calls:>6}{h.total_hits:>6}{h.total_failures:>6}{h.skipped:>6}"
+                  f"{h.lifetime_success_rate*100:>6.0f}%{h.avg_latency:>8.2f}{p.hits_per_credit:>8.2f}{h.trips:>6}")
+
+
+def build_provider_chain(apollo_key: str = None, hunter_key: str = None,
+                         reorder: bool = True) -> ProviderChain:
+    """
+    Default chain: Apollo people/match → Apollo mixed_people/search → Hunter domain-search.
+    """
+    providers = []
+    
+    if apollo_key:
+        apollo = ApolloEnricher(apollo_key)
+        providers.append(EnrichmentProvider(
+            'apollo_match', apollo.match_person, PROVIDER_CREDIT_COSTS['apollo_match'], api='apollo'))
+        providers.append(EnrichmentProvider(
+            'apollo_search', apollo.search_people, PROVIDER_CREDIT_COSTS['apollo_search'], api='apollo'))
+    
+    if hunter_key:
+        hunter = HunterEnricher(hunter_key)
+        providers.append(EnrichmentProvider(
+            'hunter_domain', hunter.find_contact, PROVIDER_CREDIT_COSTS['hunter_domain'], api='hunter'))
+    
+    return ProviderChain(providers, reorder=reorder)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # DATA PROCESSING
 # ═══════════════════════════════════════════════════════════════════════════
 
-def load_sco_data(file_path: str) -> pd.DataFrame:
+def open_sco_source(file_path: str, member: str = None):
+    """
+    Open an SCO download as a binary stream, decompressing on the fly.
+    Supports plain CSV, .gz, .xz, .zst (needs `zstandard`) and .zip.
+    For .zip, reads `member` if given, otherwise the largest .csv inside.
+    The caller is responsible for closing the returned stream.
+    """
+    lower = file_path.lower()
+    
+    if lower.endswith('.gz'):
+        return gzip.open(file_path, 'rb')
+    
+    if lower.endswith('.xz'):
+        return lzma.open(file_path, 'rb')
+    
+    if lower.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading .zst files requires zstandard: pip install zstandard")
+        raw = open(file_path, 'rb')
+        # read_across_frames: pzstd / `zstd -T` / concatenated files have several frames
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True)
+    
+    if lower.endswith('.zip'):
+        archive = zipfile.ZipFile(file_path)
+        name = member or _pick_zip_member(archive)
+        try:
+            stream = archive.open(name)
+        except KeyError:
+            archive.close()
+            raise ValueError(f"'{name}' not found in {file_path}. Available: {archive.namelist()}")
+        # ZipExtFile keeps its own handle to the archive file
+        archive.close()
+        return stream
+    
+    return open(file_path, 'rb')
+
+
+def _pick_zip_member(archive: zipfile.ZipFile) -> str:
+    """Pick the data file from an SCO zip: the largest .csv member."""
+    members = [i for i in archive.infolist() if not i.is_dir()]
+    csvs = [i for i in members if i.filename.lower().endswith('.csv')]
+    candidates = csvs or members
+    
+    if not candidates:
+        raise ValueError(f"No files found in {archive.filename}")
+    
+    return max(candidates, key=lambda i: i.file_size).filename
+
+
+def load_sco_data(file_path: str, member: str = None) -> pd.DataFrame:
     """
     Load California SCO unclaimed property CSV.
-    Handles large files with chunking if needed.
+    Accepts compressed/archived downloads (see open_sco_source).
     """
     print(f"📂 Loading data from: {file_path}")
     
     try:
-        df = pd.read_csv(file_path, low_memory=False, encoding='utf-8')
+        with open_sco_source(file_path, member) as f:
+            df = pd.read_csv(f, low_memory=False, encoding='utf-8')
     except UnicodeDecodeError:
-        df = pd.read_csv(file_path, low_memory=False, encoding='latin-1')
+        with open_sco_source(file_path, member) as f:
+            df = pd.read_csv(f, low_memory=False, encoding='latin-1')
     
     print(f"   ✓ Loaded {len(df):,} total records")
     return df
@@ -378,32 +774,33 @@ def identify_columns(df: pd.DataFrame) -> Tuple[str, str, str]:
     return cash_col, owner_col, city_col
 
 
-def filter_whales(df: pd.DataFrame, limit: int = None) -> pd.DataFrame:
+def filter_whales(df: pd.DataFrame, limit: int = None, min_value: int = None,
+                  cities: List[str] = None) -> pd.DataFrame:
     """
     Apply whale filtering criteria and return top leads.
+    Defaults to MIN_WHALE_VALUE and TARGET_CITIES when not given.
     """
     print("\n🔍 Applying whale filters...")
     
+    min_value = MIN_WHALE_VALUE if min_value is None else min_value
+    cities = cities or TARGET_CITIES
+    
     cash_col, owner_col, city_col = identify_columns(df)
     print(f"   Using columns: {cash_col}, {owner_col}, {city_col}")
     
     # Clean and convert cash values
-    df[cash_col] = pd.to_numeric(
-        df[cash_col].astype(str).str.replace(r'[$,]', '', regex=True),
-        errors='coerce'
-    ).fillna(0)
+    df[cash_col] = clean_cash_values(df[cash_col])
     
-    # Filter 1: High value (>= $5,000)
-    is_whale = df[cash_col] >= MIN_WHALE_VALUE
-    print(f"   Filter 1 (>= ${MIN_WHALE_VALUE:,}): {is_whale.sum():,} records")
+    # Filter 1: High value (>= min_value)
+    is_whale = df[cash_col] >= min_value
+    print(f"   Filter 1 (>= ${min_value:,}): {is_whale.sum():,} records")
     
     # Filter 2: Business entities
     is_business = df[owner_col].str.contains(BUSINESS_PATTERNS, na=False, case=False, regex=True)
     print(f"   Filter 2 (Business entity): {is_business.sum():,} records")
     
     # Filter 3: Target cities
-    city_pattern = '|'.join(TARGET_CITIES)
-    is_local = df[city_col].str.upper().str.contains(city_pattern, na=False, regex=True)
+    is_local = city_mask(df[city_col], cities)
     print(f"   Filter 3 (Target cities): {is_local.sum():,} records")
     
     # Combined filter
@@ -421,20 +818,178 @@ def filter_whales(df: pd.DataFrame, limit: int = None) -> pd.DataFrame:
     return whales, cash_col, owner_col, city_col
 
 
+def clean_cash_values(values: pd.Series) -> pd.Series:
+    """Strip '$' and ',' from SCO cash values and convert to numbers."""
+    return pd.to_numeric(
+        values.astype(str).str.replace(r'[$,]', '', regex=True),
+        errors='coerce'
+    ).fillna(0)
+
+
+def city_mask(cities_series: pd.Series, cities: List[str]) -> pd.Series:
+    """Boolean mask of rows whose city matches any of the target cities."""
+    city_pattern = '|'.join(map(re.escape, cities))
+    return cities_series.str.upper().str.contains(city_pattern, na=False, regex=True)
+
+
+def load_profiles(config_path: str = None, names: List[str] = None) -> Dict[str, Dict]:
+    """
+    Resolve region profiles from REGION_PROFILES and an optional JSON config.
+    Profiles in the config file override built-ins of the same name.
+    If names are given, only those profiles are returned (in that order);
+    otherwise a config runs just its own profiles, and no config runs all built-ins.
+    """
+    profiles = {name: dict(profile) for name, profile in REGION_PROFILES.items()}
+    
+    if config_path:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict):
+            raise ValueError(f"Profile config {config_path} must be a JSON object of profiles")
+        profiles.update({name: dict(profile) for name, profile in config.items()})
+        if not names:
+            names = list(config)
+    
+    if names:
+        unknown = [n for n in names if n not in profiles]
+        if unknown:
+            raise ValueError(f"Unknown region profile(s): {unknown}. Available: {list(profiles)}")
+        profiles = {n: profiles[n] for n in names}
+    
+    for name, profile in profiles.items():
+        cities = profile.get('cities')
+        if not isinstance(cities, list) or not cities or not all(isinstance(c, str) and c.strip() for c in cities):
+            raise ValueError(f"Region profile '{name}': 'cities' must be a non-empty list of city names")
+        profile['cities'] = [c.strip().upper() for c in cities]
+        
+        for field, default in (('min_value', MIN_WHALE_VALUE), ('limit', DEFAULT_LEAD_LIMIT)):
+            value = profile.get(field, default)
+            try:
+                if isinstance(value, bool):
+                    raise TypeError
+                profile[field] = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Region profile '{name}': '{field}' must be an integer, got {value!r}")
+        
+        profile.setdefault('output', f"{name}_whales.csv")
+        if not isinstance(profile['output'], str) or not profile['output'].strip():
+            raise ValueError(f"Region profile '{name}': 'output' must be a file path")
+    
+    # Two profiles writing the same file would silently overwrite each other's export
+    by_output = {}
+    for name, profile in profiles.items():
+        by_output.setdefault(os.path.abspath(profile['output']), []).append(name)
+    clashes = [names for names in by_output.values() if len(names) > 1]
+    if clashes:
+        raise ValueError("Region profiles share an output file: "
+                         + '; '.join(', '.join(names) for names in clashes))
+    
+    return profiles
+
+
+def scan_profiles(file_path: str, profiles: Dict[str, Dict],
+                  chunksize: int = DEFAULT_CHUNK_SIZE, member: str = None) -> Dict[str, Tuple]:
+    """
+    Evaluate every region profile in a single streaming pass over the SCO file.
+    
+    Cash cleaning and the business-entity filter run once per chunk and are
+    shared by all profiles; only the value/city masks are per profile. Each
+    profile keeps just its top `limit` rows between chunks, so memory stays
+    bounded regardless of file size. Compressed inputs are decompressed as
+    they are read (see open_sco_source); `member` selects the file in a zip.
+    
+    Returns: { profile_name: (whales, cash_col, owner_col, city_col) }
+    """
+    print(f"📂 Scanning data from: {file_path}")
+    print(f"   Profiles: {', '.join(profiles)}")
+    
+    try:
+        with open_sco_source(file_path, member) as f:
+            return _scan_profiles(f, profiles, chunksize, encoding='utf-8')
+    except UnicodeDecodeError:
+        print("   ⚠️ Not UTF-8, restarting scan as latin-1")
+        with open_sco_source(file_path, member) as f:
+            return _scan_profiles(f, profiles, chunksize, encoding='latin-1')
+
+
+def _scan_profiles(source, profiles: Dict[str, Dict], chunksize: int,
+                   encoding: str) -> Dict[str, Tuple]:
+    """Single-pass scan for scan_profiles() over an open stream with a fixed encoding."""
+    matches = {name: [] for name in profiles}
+    counts = {name: {'whale': 0, 'local': 0} for name in profiles}
+    business_count = 0
+    total = 0
+    cash_col = owner_col = city_col = None
+    
+    # dtype=str: per-chunk type inference turns an all-blank owner/city column
+    # into floats, which breaks the .str filters (cash is parsed from strings anyway)
+    reader = pd.read_csv(source, dtype=str, encoding=encoding, chunksize=chunksize)
+    
+    for chunk in reader:
+        total += len(chunk)
+        cash_col, owner_col, city_col = identify_columns(chunk)
+        chunk[cash_col] = clean_cash_values(chunk[cash_col])
+        
+        # Shared across profiles: business entities only
+        is_business = chunk[owner_col].str.contains(BUSINESS_PATTERNS, na=False, case=False, regex=True)
+        business_count += int(is_business.sum())
+        candidates = chunk[is_business]
+        
+        for name, profile in profiles.items():
+            is_whale = candidates[cash_col] >= profile['min_value']
+            is_local = city_mask(candidates[city_col], profile['cities'])
+            counts[name]['whale'] += int(is_whale.sum())
+            counts[name]['local'] += int(is_local.sum())
+            
+            hits = candidates[is_whale & is_local]
+            if len(hits):
+                matches[name].append(hits)
+                # Keep only the current top `limit` rows for this profile
+                if profile['limit'] and len(matches[name]) > 1:
+                    merged = pd.concat(matches[name])
+                    matches[name] = [merged.nlargest(profile['limit'], cash_col)]
+        
+        print(f"   … {total:,} records scanned", end='\r')
+    
+    print(f"   ✓ Scanned {total:,} total records ({business_count:,} business entities)")
+    
+    results = {}
+    for name, profile in profiles.items():
+        if matches[name]:
+            whales = pd.concat(matches[name])
+        else:
+            whales = pd.DataFrame(columns=[c for c in (cash_col, owner_col, city_col) if c])
+        whales = whales.sort_values(by=cash_col, ascending=False) if len(whales) else whales
+        if profile['limit']:
+            whales = whales.head(profile['limit'])
+        
+        print(f"\n🔍 Profile '{name}' (>= ${profile['min_value']:,}, {len(profile['cities'])} cities)")
+        print(f"   Value + Business:  {counts[name]['whale']:,} records")
+        print(f"   City + Business:   {counts[name]['local']:,} records")
+        print(f"   🐋 Whales:          {len(whales):,} records")
+        
+        results[name] = (whales.copy(), cash_col, owner_col, city_col)
+    
+    return results
+
+
 def enrich_leads(whales: pd.DataFrame, owner_col: str, city_col: str, 
-                 apollo_key: str = None, hunter_key: str = None) -> pd.DataFrame:
+                 apollo_key: str = None, hunter_key: str = None,
+                 chain: ProviderChain = None) -> pd.DataFrame:
     """
     Enrich whale leads with CFO/Controller/Owner contact information.
-    Uses Apollo.io /v1/people/match for fast, accurate results.
+    Runs each lead through the provider chain (see build_provider_chain).
+    Pass a shared `chain` to reuse memoised results and provider health
+    across calls, e.g. one per region profile.
     """
     print("\n🔎 Enriching leads with decision-maker contacts...")
     print("   Target Titles: CFO, Controller, Owner, CEO, President")
     
     # Initialize enrichers
-    apollo = ApolloEnricher(apollo_key) if apollo_key else None
-    hunter = HunterEnricher(hunter_key) if hunter_key else None
+    if chain is None:
+        chain = build_provider_chain(apollo_key, hunter_key)
     
-    if not apollo and not hunter:
+    if not chain:
         print("   ⚠️ No enrichment API keys provided. Skipping enrichment.")
         whales['CONTACT_NAME'] = ''
         whales['CONTACT_TITLE'] = ''
@@ -461,17 +1016,7 @@ def enrich_leads(whales: pd.DataFrame, owner_col: str, city_col: str,
         progress = f"[{idx+1:3d}/{total}]"
         print(f"   {progress} {company[:45]:<45}", end='')
         
-        contact = None
-        
-        # Try Apollo first (faster /v1/people/match endpoint)
-        if apollo:
-            contact = apollo.enrich_whale(company, city)
-            time.sleep(APOLLO_RATE_LIMIT_DELAY)
-        
-        # Fallback to Hunter if Apollo didn't find anyone
-        if not contact and hunter:
-            contact = hunter.search_domain(company)
-            time.sleep(APOLLO_RATE_LIMIT_DELAY)
+        contact = chain.enrich(company, city)
         
         if contact and (contact.get('email') or contact.get('phone')):
             enriched_count += 1
@@ -518,6 +1063,7 @@ def enrich_leads(whales: pd.DataFrame, owner_col: str, city_col: str,
     print(f"   With Email:         {with_email} ({with_email/total*100:.1f}%)")
     print(f"   Needs Research:     {total - enriched_count}")
     print(f"   " + "="*50)
+    chain.print_summary()
     
     return whales
 
@@ -636,19 +1182,49 @@ def main():
     parser = argparse.ArgumentParser(
         description='LawAuditor Whale Scraper v2.0 - CA Unclaimed Property + Lead Enrichment'
     )
-    parser.add_argument('input_file', help='SCO CSV file (Properties $500 and up)')
-    parser.add_argument('-o', '--output', default='sac_bay_whales.csv', help='Output filename')
-    parser.add_argument('--min-value', type=int, default=MIN_WHALE_VALUE, help='Minimum cash value')
-    parser.add_argument('--limit', type=int, default=DEFAULT_LEAD_LIMIT, help='Max leads to process')
+    parser.add_argument('input_file', help='SCO CSV file (Properties $500 and up); .zip/.gz/.zst/.xz accepted')
+    parser.add_argument('--zip-member', help='File inside a .zip input to read (default: largest .csv)')
+    parser.add_argument('-o', '--output', help='Output filename (default: sac_bay_whales.csv)')
+    parser.add_argument('--min-value', type=int, help=f'Minimum cash value (default: {MIN_WHALE_VALUE})')
+    parser.add_argument('--limit', type=int, help=f'Max leads to process (default: {DEFAULT_LEAD_LIMIT})')
+    parser.add_argument('--profiles', help='Comma-separated region profiles to run in one pass '
+                                           f'(built-in: {",".join(REGION_PROFILES)})')
+    parser.add_argument('--profile-config', help='JSON file of region profiles (cities, min_value, limit, output)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per chunk when scanning')
     parser.add_argument('--enrich', action='store_true', help='Enable lead enrichment')
     parser.add_argument('--apollo-key', help='Apollo.io API key (or set APOLLO_API_KEY env var)')
     parser.add_argument('--hunter-key', help='Hunter.io API key (or set HUNTER_API_KEY env var)')
+    parser.add_argument('--no-reorder', action='store_true',
+                        help='Keep the provider chain in fixed order instead of ranking by hits per credit')
     
     args = parser.parse_args()
     
-    # Override globals if specified
-    global MIN_WHALE_VALUE
-    MIN_WHALE_VALUE = args.min_value
+    if args.zip_member and not args.input_file.lower().endswith('.zip'):
+        parser.error('--zip-member only applies to .zip inputs')
+    
+    # Resolve region profiles (default: single Sacramento + Bay Area run from CLI flags)
+    if args.profiles or args.profile_config:
+        # Per-profile settings live in the profiles; don't let single-run flags look effective
+        single_run_flags = [flag for flag, value in (('-o/--output', args.output),
+                                                     ('--min-value', args.min_value),
+                                                     ('--limit', args.limit)) if value is not None]
+        if single_run_flags:
+            parser.error(f"{', '.join(single_run_flags)} cannot be combined with --profiles/--profile-config; "
+                         "set output, min_value and limit in the profile config instead")
+        names = [n.strip() for n in args.profiles.split(',') if n.strip()] if args.profiles else None
+        try:
+            profiles = load_profiles(args.profile_config, names)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    else:
+        profiles = {
+            'default': {
+                'cities': TARGET_CITIES,
+                'min_value': MIN_WHALE_VALUE if args.min_value is None else args.min_value,
+                'limit': DEFAULT_LEAD_LIMIT if args.limit is None else args.limit,
+                'output': args.output or 'sac_bay_whales.csv'
+            }
+        }
     
     # Get API keys from args or environment
     apollo_key = args.apollo_key or os.environ.get('APOLLO_API_KEY')
@@ -659,40 +1235,53 @@ def main():
     print("   California Unclaimed Property + Lead Enrichment")
     print("="*70)
     print(f"   Input:       {args.input_file}")
-    print(f"   Output:      {args.output}")
-    print(f"   Min Value:   ${MIN_WHALE_VALUE:,}")
-    print(f"   Lead Limit:  {args.limit}")
+    for name, profile in profiles.items():
+        print(f"   Profile:     {name} → {profile['output']} "
+              f"(>= ${profile['min_value']:,}, limit {profile['limit']})")
     print(f"   Fee Cap:     {CA_FEE_CAP*100:.0f}%")
     print(f"   Enrichment:  {'Apollo.io' if apollo_key else 'Hunter.io' if hunter_key else 'Disabled'}")
     print("="*70)
     
-    # Load data
-    df = load_sco_data(args.input_file)
+    # One provider chain for the whole run: memoised lookups and health carry across profiles
+    chain = build_provider_chain(apollo_key, hunter_key, reorder=not args.no_reorder)
     
-    # Filter whales
-    whales, cash_col, owner_col, city_col = filter_whales(df, limit=args.limit)
+    # Single pass over the data for every profile
+    results = scan_profiles(args.input_file, profiles, chunksize=args.chunk_size,
+                            member=args.zip_member)
     
-    if len(whales) == 0:
-        print("\n❌ No whales found matching criteria. Try lowering --min-value.")
-        return
-    
-    # Enrich if requested
-    if args.enrich and (apollo_key or hunter_key):
-        whales = enrich_leads(whales, owner_col, city_col, apollo_key, hunter_key)
-    else:
-        # Add empty enrichment columns
-        whales['CONTACT_NAME'] = ''
-        whales['CONTACT_TITLE'] = ''
-        whales['CONTACT_EMAIL'] = ''
-        whales['CONTACT_PHONE'] = ''
-        whales['LINKEDIN_URL'] = ''
-        whales['ENRICHMENT_STATUS'] = 'Needs Manual Research'
+    exported = []
+    for name, (whales, cash_col, owner_col, city_col) in results.items():
+        output = profiles[name]['output']
+        
+        print("\n" + "="*70)
+        print(f"📍 PROFILE: {name}")
+        print("="*70)
+        
+        if len(whales) == 0:
+            print(f"\n❌ No whales found for '{name}'. Try lowering its min_value.")
+            continue
+        
+        # Enrich if requested
+        if args.enrich and (apollo_key or hunter_key):
+            whales = enrich_leads(whales, owner_col, city_col, chain=chain)
+        else:
+            # Add empty enrichment columns
+            whales['CONTACT_NAME'] = ''
+            whales['CONTACT_TITLE'] = ''
+            whales['CONTACT_EMAIL'] = ''
+            whales['CONTACT_PHONE'] = ''
+            whales['LINKEDIN_URL'] = ''
+            whales['ENRICHMENT_STATUS'] = 'Needs Manual Research'
+        
+        # Score and export
+        score_and_export(whales, cash_col, owner_col, city_col, output)
+        exported.append(output)
     
-    # Score and export
-    score_and_export(whales, cash_col, owner_col, city_col, args.output)
+    if not exported:
+        return
     
     print(f"\n🎯 NEXT STEPS:")
-    print(f"   1. Import {args.output} into LawAuditor Admin Dashboard")
+    print(f"   1. Import {', '.join(exported)} into LawAuditor Admin Dashboard")
     print(f"   2. Prioritize 'Ready to Contact' leads")
     print(f"   3. Use click-to-call/email from dashboard")
     print(f"   4. Convert whales → Legal audit cross-sell")